@@ -1,13 +1,47 @@
 """Arkiv SDK client wrapper for v1.0.0a8 (corrected API based on package exploration)."""
 
+import asyncio
+import contextlib
+import itertools
 import logging
-from typing import List, Dict, Any, Optional
+import random
+import re
+from typing import List, Dict, Any, Optional, Iterable, AsyncContextManager
+import aiohttp
 from arkiv import AsyncArkiv, NamedAccount
 from arkiv.types import Attributes, Entity, QueryOptions, QueryResult
 
 
 logger = logging.getLogger(__name__)
 
+# JSON-RPC error phrases for failures where the transaction is known not to
+# have been accepted, so resubmitting cannot create duplicate entities.
+# Timeouts and dropped connections are deliberately absent: the batch may
+# already be on chain when they surface. Bare status codes are not matched
+# in messages either, since tx hashes embedded in errors can contain them.
+_RETRYABLE_ERROR_PATTERN = re.compile(
+    r"too many requests"
+    r"|rate limit"
+    r"|nonce too (?:low|high)"
+    r"|invalid nonce"
+    r"|transaction underpriced",
+    re.IGNORECASE
+)
+
+_HTTP_TOO_MANY_REQUESTS = 429
+
+
+def _is_retryable_error(error: BaseException) -> bool:
+    """Return True for rate-limit/nonce/underpriced rejections that are safe to resubmit."""
+    # Providers may wrap the transport error, so follow the explicit cause chain
+    while error is not None:
+        if isinstance(error, aiohttp.ClientResponseError) and error.status == _HTTP_TOO_MANY_REQUESTS:
+            return True
+        if _RETRYABLE_ERROR_PATTERN.search(str(error)):
+            return True
+        error = error.__cause__
+    return False
+
 
 class ArkivClient:
     """
@@ -41,8 +75,9 @@ class ArkivClient:
         
         self.account = NamedAccount.from_private_key("mystery_oracle", hex_key)
         
-        # Client will be created in async context manager
+        # Client and HTTP session will be created in async context manager
         self.client: Optional[AsyncArkiv] = None
+        self._session: Optional[aiohttp.ClientSession] = None
     
     async def __aenter__(self):
         """Enter async context manager - create AsyncArkiv client."""
@@ -52,21 +87,46 @@ class ArkivClient:
         # Use .http().async_mode() to get AsyncHTTPProvider
         provider = ProviderBuilder().custom(self.rpc_url).http().async_mode().build()
         
-        # Create async client - AsyncArkiv has its own context manager
-        self.client = AsyncArkiv(provider=provider, account=self.account)
+        # One keep-alive connection pool for every RPC made in this context, so
+        # concurrent batches reuse sockets instead of paying a TLS handshake each
+        if hasattr(provider, "cache_async_session"):
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit_per_host=16, keepalive_timeout=60, ttl_dns_cache=300)
+            )
         
-        # Enter the AsyncArkiv context manager
-        await self.client.__aenter__()
+        try:
+            if self._session:
+                await provider.cache_async_session(self._session)
+            
+            # Create async client - AsyncArkiv has its own context manager
+            self.client = AsyncArkiv(provider=provider, account=self.account)
+            
+            # Enter the AsyncArkiv context manager
+            await self.client.__aenter__()
+        except BaseException:
+            # __aexit__ is not called when __aenter__ fails, so release the pool here
+            self.client = None
+            await self._close_session()
+            raise
         
         return self
     
     async def __aexit__(self, exc_type, exc_val, exc_tb):
         """Exit async context manager - cleanup."""
-        if self.client:
-            # Exit the AsyncArkiv context manager
-            await self.client.__aexit__(exc_type, exc_val, exc_tb)
+        try:
+            if self.client:
+                # Exit the AsyncArkiv context manager
+                await self.client.__aexit__(exc_type, exc_val, exc_tb)
+        finally:
+            await self._close_session()
         return False
     
+    async def _close_session(self):
+        """Close the shared HTTP session, if one was opened."""
+        if self._session:
+            await self._session.close()
+            self._session = None
+    
     async def create_entity(
         self,
         payload: bytes,
@@ -111,11 +171,17 @@ class ArkivClient:
     
     async def create_entities_batch(
         self, 
-        entities: List[Dict[str, Any]]
+        entities: List[Dict[str, Any]],
+        max_attempts: int = 3
     ) -> List[str]:
         """
         Create multiple entities in a single transaction.
         
+        Rejections where the transaction was never accepted (rate limits, nonce
+        races from concurrent batches, underpriced replacements) are retried
+        with jittered exponential backoff. Timeouts and connection errors are
+        raised immediately, since the batch may already have landed.
+        
         Args:
             entities: List of entity specifications with keys:
                 - payload: bytes
@@ -123,10 +189,13 @@ class ArkivClient:
                 - attributes: Dict[str, Any]
                 - expires_in: int (optional, defaults to 43200 seconds)
                 - btl: int (optional, blocks to live - overrides expires_in)
+            max_attempts: Maximum number of attempts for rejected-but-retryable errors
         
         Returns:
             List of entity keys
         """
+        if max_attempts < 1:
+            raise ValueError("max_attempts must be at least 1")
         if not self.client:
             raise RuntimeError("Client not initialized. Use 'async with ArkivClient() as client:'")
         
@@ -150,12 +219,75 @@ class ArkivClient:
                 btl=btl
             ))
         
-        receipt = await self.client.arkiv.execute(Operations(creates=creates))
+        operations = Operations(creates=creates)
+        for attempt in range(max_attempts):
+            try:
+                receipt = await self.client.arkiv.execute(operations)
+                break
+            except Exception as e:
+                if attempt < max_attempts - 1 and _is_retryable_error(e):
+                    wait_time = 0.2 * (2 ** attempt) + random.uniform(0, 0.1)
+                    logger.warning(f"   ⚠️  Batch create failed ({e}), retrying in {wait_time:.2f}s (attempt {attempt + 1}/{max_attempts})...")
+                    await asyncio.sleep(wait_time)
+                    continue
+                raise
         
         # Extract entity keys from receipt create events
         entity_keys = [event.entity_key for event in receipt.creates]
         return entity_keys
     
+    async def create_entities_batched(
+        self,
+        entities: Iterable[Dict[str, Any]],
+        batch_size: int = 10,
+        max_in_flight: int = 8,
+        rate_limiter: Optional[AsyncContextManager] = None
+    ) -> List[str]:
+        """
+        Create entities as concurrent batch transactions.
+        
+        Batches are cut lazily from ``entities`` and a slot is taken before
+        each one is dispatched, so at most ``max_in_flight`` batches are built
+        or sending at once. If any batch fails, the remaining batches are
+        cancelled and the failure is raised (as an ExceptionGroup) only after
+        every batch task has finished, so nothing outlives this call.
+        
+        Args:
+            entities: Entity specifications, as for create_entities_batch
+            batch_size: Entities per transaction
+            max_in_flight: Maximum number of concurrent batch transactions
+            rate_limiter: Optional async context manager entered around each
+                batch (e.g. utils.AsyncRateLimiter) to pace transactions
+        
+        Returns:
+            Entity keys for all entities, in input order
+        """
+        if batch_size < 1 or max_in_flight < 1:
+            raise ValueError("batch_size and max_in_flight must be at least 1")
+        
+        semaphore = asyncio.Semaphore(max_in_flight)
+        
+        async def push_batch(batch_num, batch):
+            try:
+                async with rate_limiter or contextlib.nullcontext():
+                    keys = await self.create_entities_batch(batch)
+            finally:
+                semaphore.release()
+            logger.debug("   ✅ Batch %s: %s entities", batch_num, len(keys))
+            return keys
+        
+        tasks = []
+        entity_iter = iter(entities)
+        async with asyncio.TaskGroup() as group:
+            while True:
+                await semaphore.acquire()
+                batch = list(itertools.islice(entity_iter, batch_size))
+                if not batch:
+                    break
+                tasks.append(group.create_task(push_batch(len(tasks) + 1, batch)))
+        
+        return [key for task in tasks for key in task.result()]
+    
     async def query_entities(self, query_string: str, limit: int = 100) -> List[Entity]:
         """
         Query entities using Arkiv query language.
@@ -180,6 +312,28 @@ class ArkivClient:
         # Return the entities list from the QueryResult
         return query_result.entities
     
+    async def query_entities_many(
+        self,
+        query_strings: List[str],
+        limit: int = 100
+    ) -> List[List[Entity]]:
+        """
+        Run several queries concurrently over the shared async provider.
+        
+        Args:
+            query_strings: Queries in Arkiv query language
+            limit: Maximum number of results per query (default 100)
+        
+        Returns:
+            One list of matching Entity objects per query, in input order
+        """
+        if not self.client:
+            raise RuntimeError("Client not initialized. Use 'async with ArkivClient() as client:'")
+        
+        return list(await asyncio.gather(
+            *(self.query_entities(q, limit=limit) for q in query_strings)
+        ))
+    
     async def get_entity(self, entity_key: str) -> Optional[Entity]:
         """
         Get a specific entity by its key.
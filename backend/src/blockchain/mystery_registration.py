@@ -1,7 +1,7 @@
 """Mystery registration on smart contract."""
 
 import logging
-from typing import Dict, Any
+from typing import Dict, Any, Union
 from web3 import Web3
 
 from .web3_client import Web3Client
@@ -92,17 +92,21 @@ class MysteryRegistrar:
                 "error": str(e)
             }
     
-    async def get_mystery_on_chain(self, mystery_id: str) -> Dict[str, Any]:
+    async def get_mystery_on_chain(self, mystery_id: Union[str, bytes]) -> Dict[str, Any]:
         """
         Get mystery data from blockchain.
         
         Args:
-            mystery_id: Mystery ID string
+            mystery_id: Mystery ID string, or its already-hashed bytes32
+                (e.g. from register_mystery's "mystery_id_bytes32")
         
         Returns:
             Mystery data from contract
         """
-        mystery_id_bytes = self.client.string_to_bytes32(mystery_id)
+        if isinstance(mystery_id, bytes):
+            mystery_id_bytes = mystery_id
+        else:
+            mystery_id_bytes = self.client.string_to_bytes32(mystery_id)
         
         try:
             mystery_data = await self.client.contract.functions.getMystery(
@@ -663,9 +663,8 @@ OUTPUT FORMAT (JSON array):
         temp_dir = Path("outputs/temp_images")
         temp_dir.mkdir(parents=True, exist_ok=True)
         
-        generated_images = []
-        
-        for img_clue in image_clues:
+        async def generate_one(img_clue):
+            """Generate a single clue image; failures are logged and skipped."""
             img_id = "unknown"
             try:
                 # ImageClue is a dataclass, access attributes directly
@@ -684,11 +683,21 @@ OUTPUT FORMAT (JSON array):
                 )
                 
                 if result:
-                    generated_images.append(result)
                     logger.info(f"   ✅ Generated: {img_id}")
+                return result
                 
             except Exception as e:
                 logger.warning(f"   ⚠️  Failed to generate {img_id}: {e}")
+                return None
+        
+        # Execute in parallel batches (gather keeps clue order)
+        batch_size = self.config.get("image_generation", {}).get("parallel_batch_size", 3)
+        generated_images = []
+        
+        for i in range(0, len(image_clues), batch_size):
+            batch = image_clues[i:i+batch_size]
+            batch_results = await asyncio.gather(*(generate_one(c) for c in batch))
+            generated_images.extend(r for r in batch_results if r)
         
         logger.info(f"   ✅ Generated {len(generated_images)}/{len(image_clues)} images")
         logger.info("")
@@ -3,11 +3,16 @@
 from .config import load_config
 from .logger import setup_logger
 from .llm_clients import CerebrasClient, OpenAIClient
+from .json_codec import dumps_json, loads_json
+from .rate_limiter import AsyncRateLimiter
 
 __all__ = [
     'load_config',
     'setup_logger',
     'CerebrasClient',
-    'OpenAIClient'
+    'OpenAIClient',
+    'dumps_json',
+    'loads_json',
+    'AsyncRateLimiter'
 ]
 
@@ -0,0 +1,41 @@
+"""JSON encoding helpers for entity payloads (orjson when available)."""
+
+import json
+from typing import Any, Union
+
+try:
+    import orjson
+except ImportError:  # optional speed-up, stdlib json is the fallback
+    orjson = None
+
+
+def dumps_json(obj: Any) -> bytes:
+    """
+    Serialize an object to UTF-8 JSON bytes.
+    
+    Args:
+        obj: JSON-serializable object
+    
+    Returns:
+        Encoded JSON bytes, ready to use as an Arkiv payload
+    """
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj).encode('utf-8')
+
+
+def loads_json(data: Union[bytes, str]) -> Any:
+    """
+    Parse JSON from bytes or str.
+    
+    Args:
+        data: JSON document (e.g. an entity payload)
+    
+    Returns:
+        Decoded Python object
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    if isinstance(data, (bytes, bytearray)):
+        data = data.decode('utf-8')
+    return json.loads(data)
@@ -0,0 +1,49 @@
+"""Token-bucket rate limiter for pacing async RPC calls."""
+
+import asyncio
+import time
+
+
+class AsyncRateLimiter:
+    """
+    Allow at most ``max_rate`` acquisitions per ``time_period`` seconds.
+
+    Tokens refill continuously, so short bursts up to ``max_rate`` go through
+    immediately and sustained load is paced at the configured rate.
+
+    Usage:
+        limiter = AsyncRateLimiter(max_rate=20, time_period=1)
+        async with limiter:
+            await client.create_entities_batch(batch)
+    """
+
+    def __init__(self, max_rate: float, time_period: float = 1.0):
+        if max_rate <= 0 or time_period <= 0:
+            raise ValueError("max_rate and time_period must be positive")
+        self.max_rate = max_rate
+        self.time_period = time_period
+        self._rate_per_sec = max_rate / time_period
+        self._tokens = float(max_rate)
+        self._last = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self._tokens = min(self.max_rate, self._tokens + (now - self._last) * self._rate_per_sec)
+        self._last = now
+
+    async def acquire(self) -> None:
+        """Wait until a token is available, then consume it."""
+        async with self._lock:
+            self._refill()
+            while self._tokens < 1:
+                await asyncio.sleep((1 - self._tokens) / self._rate_per_sec)
+                self._refill()
+            self._tokens -= 1
+
+    async def __aenter__(self):
+        await self.acquire()
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        return None
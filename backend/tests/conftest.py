@@ -0,0 +1,10 @@
+"""Shared pytest fixtures for the backend test suite."""
+
+import pytest
+
+
+@pytest.fixture(scope="module")
+def identity_generator():
+    """Identity node generator shared by every test in a module."""
+    from narrative.conspiracy.nodes.identity_nodes import IdentityNodeGenerator
+    return IdentityNodeGenerator()
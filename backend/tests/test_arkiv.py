@@ -3,10 +3,6 @@
 
 import asyncio
 import sys
-from pathlib import Path
-
-# Add src to path
-sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
 
 from utils import load_config, setup_logger
 from arkiv_integration import ArkivClient
@@ -0,0 +1,100 @@
+"""Test ArkivClient.create_entities_batched fan-out, ordering and failure handling."""
+
+import asyncio
+
+import pytest
+
+from arkiv_integration.client import ArkivClient
+
+
+def _entities(count):
+    return [{"n": i} for i in range(count)]
+
+
+def _client(create_entities_batch):
+    """ArkivClient whose single-transaction create is replaced by a test double."""
+    client = ArkivClient.__new__(ArkivClient)
+    client.create_entities_batch = create_entities_batch
+    return client
+
+
+def test_keys_keep_input_order_across_batches():
+    """Keys come back in entity order even when later batches finish first."""
+    batch_sizes = []
+
+    async def create(batch):
+        batch_sizes.append(len(batch))
+        await asyncio.sleep((30 - batch[0]["n"]) / 1000)  # first batch finishes last
+        return [f"0x{e['n']}" for e in batch]
+
+    keys = asyncio.run(_client(create).create_entities_batched(_entities(23), batch_size=10))
+
+    assert keys == [f"0x{i}" for i in range(23)]
+    assert batch_sizes == [10, 10, 3]
+
+
+def test_in_flight_batches_are_capped():
+    """No more than max_in_flight batch transactions run at once."""
+    in_flight = 0
+    peak = 0
+
+    async def create(batch):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        return [e["n"] for e in batch]
+
+    keys = asyncio.run(
+        _client(create).create_entities_batched(_entities(50), batch_size=5, max_in_flight=2)
+    )
+
+    assert keys == list(range(50))
+    assert peak == 2
+
+
+def test_failure_cancels_remaining_batches():
+    """A failed batch cancels its siblings and nothing is left running afterwards."""
+    started = []
+    cancelled = []
+
+    async def create(batch):
+        batch_num = batch[0]["n"] // 10 + 1
+        started.append(batch_num)
+        if batch_num == 1:
+            raise ValueError("nonce too low")
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            cancelled.append(batch_num)
+            raise
+        return []
+
+    async def run():
+        with pytest.raises(ExceptionGroup) as excinfo:
+            await _client(create).create_entities_batched(
+                _entities(100), batch_size=10, max_in_flight=3
+            )
+        assert all(task.done() for task in asyncio.all_tasks() if task is not asyncio.current_task())
+        return excinfo.value
+
+    error = asyncio.run(run())
+
+    assert [type(e) for e in error.exceptions] == [ValueError]
+    # Only the first max_in_flight batches were ever dispatched
+    assert sorted(started) == [1, 2, 3]
+    assert sorted(cancelled) == [2, 3]
+
+
+@pytest.mark.parametrize("batch_size, max_in_flight", [(0, 8), (10, 0)])
+def test_rejects_non_positive_sizes(batch_size, max_in_flight):
+    """Zero-sized batches or no in-flight slots are usage errors."""
+
+    async def create(batch):
+        raise AssertionError("should not be called")
+
+    with pytest.raises(ValueError):
+        asyncio.run(_client(create).create_entities_batched(
+            _entities(3), batch_size=batch_size, max_in_flight=max_in_flight
+        ))
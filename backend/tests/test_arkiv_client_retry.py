@@ -0,0 +1,121 @@
+"""Test ArkivClient batch-create retry classification and the retry loop."""
+
+import asyncio
+from types import SimpleNamespace
+from unittest.mock import AsyncMock
+
+import aiohttp
+import arkiv.types
+import pytest
+from multidict import CIMultiDict, CIMultiDictProxy
+from yarl import URL
+
+from arkiv_integration import client as client_module
+from arkiv_integration.client import ArkivClient, _is_retryable_error
+
+
+RPC_URL = URL("https://rpc.example/rpc")
+
+
+def _http_error(status):
+    request_info = aiohttp.RequestInfo(
+        url=RPC_URL, method="POST", headers=CIMultiDictProxy(CIMultiDict()), real_url=RPC_URL
+    )
+    return aiohttp.ClientResponseError(request_info=request_info, history=(), status=status)
+
+
+def _wrapped(cause):
+    try:
+        raise RuntimeError("provider request failed") from cause
+    except RuntimeError as e:
+        return e
+
+
+@pytest.mark.parametrize("error", [
+    _http_error(429),
+    _wrapped(_http_error(429)),
+    ValueError({"code": -32005, "message": "Too Many Requests"}),
+    ValueError("rate limit exceeded"),
+    ValueError({"code": -32000, "message": "nonce too low"}),
+    ValueError("replacement transaction underpriced"),
+])
+def test_rejections_are_retryable(error):
+    """Errors proving the transaction was not accepted may be resubmitted."""
+    assert _is_retryable_error(error)
+
+
+@pytest.mark.parametrize("error", [
+    asyncio.TimeoutError(),
+    ConnectionError("Connection reset by peer"),
+    # Tx hashes in timeout messages can contain "429"; the batch may be on chain
+    Exception("Transaction HexBytes('0x8f4291c0de') is not in the chain after 120 seconds"),
+    _http_error(500),
+    _http_error(502),
+    ValueError("execution reverted"),
+])
+def test_possibly_accepted_errors_are_not_retryable(error):
+    """Timeouts, dropped connections and other failures must not be resubmitted."""
+    assert not _is_retryable_error(error)
+
+
+@pytest.fixture
+def arkiv_client(monkeypatch):
+    """ArkivClient with a mocked execute(); SDK op types are reduced to plain records."""
+    monkeypatch.setattr(arkiv.types, "CreateOp", lambda **kw: SimpleNamespace(**kw))
+    monkeypatch.setattr(arkiv.types, "Operations", lambda **kw: SimpleNamespace(**kw))
+    monkeypatch.setattr(client_module, "Attributes", dict)
+    monkeypatch.setattr(client_module.asyncio, "sleep", AsyncMock())
+
+    client = ArkivClient.__new__(ArkivClient)
+    client.client = SimpleNamespace(arkiv=SimpleNamespace(execute=AsyncMock()))
+    return client
+
+
+ENTITIES = [
+    {"payload": b"{}", "content_type": "application/json", "attributes": {"n": i}}
+    for i in range(2)
+]
+
+RECEIPT = SimpleNamespace(creates=[SimpleNamespace(entity_key=f"0x{i}") for i in range(2)])
+
+
+def test_retries_rate_limit_then_succeeds(arkiv_client):
+    """An HTTP 429 is backed off and the batch resubmitted."""
+    execute = arkiv_client.client.arkiv.execute
+    execute.side_effect = [_http_error(429), RECEIPT]
+
+    keys = asyncio.run(arkiv_client.create_entities_batch(ENTITIES))
+
+    assert keys == ["0x0", "0x1"]
+    assert execute.await_count == 2
+
+
+def test_timeout_is_raised_without_resubmitting(arkiv_client):
+    """A timeout surfaces after a single attempt; the batch may already be on chain."""
+    execute = arkiv_client.client.arkiv.execute
+    execute.side_effect = asyncio.TimeoutError()
+
+    with pytest.raises(asyncio.TimeoutError):
+        asyncio.run(arkiv_client.create_entities_batch(ENTITIES))
+
+    assert execute.await_count == 1
+
+
+def test_gives_up_after_max_attempts(arkiv_client):
+    """Persistent retryable errors are raised once max_attempts is used up."""
+    execute = arkiv_client.client.arkiv.execute
+    execute.side_effect = ValueError("nonce too low")
+
+    with pytest.raises(ValueError, match="nonce too low"):
+        asyncio.run(arkiv_client.create_entities_batch(ENTITIES, max_attempts=3))
+
+    assert execute.await_count == 3
+
+
+@pytest.mark.parametrize("max_attempts", [0, -1])
+def test_rejects_non_positive_max_attempts(arkiv_client, max_attempts):
+    """max_attempts below 1 is a usage error, not a silent no-op."""
+    with pytest.raises(ValueError):
+        asyncio.run(arkiv_client.create_entities_batch(ENTITIES, max_attempts=max_attempts))
+
+    arkiv_client.client.arkiv.execute.assert_not_awaited()
@@ -15,18 +15,18 @@ from datetime import datetime
 from dotenv import load_dotenv
 load_dotenv()
 
-backend_dir = os.path.dirname(os.path.dirname(__file__))
-sys.path.insert(0, os.path.join(backend_dir, 'src'))
-
-from models.conspiracy import ConspiracyMystery, PoliticalContext, ConspiracyPremise, MysteryAnswer, AnswerDimension
-from blockchain import Web3Client, MysteryRegistrar, ConspiracyToMysteryConverter
-
 logging.basicConfig(level=logging.INFO, format='%(message)s')
 logger = logging.getLogger(__name__)
 
+_SEP = "=" * 60
+_BANNER_TOP = "╔" + "=" * 58 + "╗"
+_BANNER_TITLE = "║" + " " * 10 + "BLOCKCHAIN-ONLY TEST (DUMMY DATA)" + " " * 14 + "║"
+_BANNER_BOTTOM = "╚" + "=" * 58 + "╝"
+
 
 def create_dummy_conspiracy():
     """Create a minimal dummy conspiracy for testing blockchain integration."""
+    from models.conspiracy import ConspiracyMystery, PoliticalContext, ConspiracyPremise, MysteryAnswer
     
     # Political context
     political_context = PoliticalContext(
@@ -105,18 +105,21 @@ async def test_blockchain_only(contract_address: str):
     3. Register on-chain
     4. Verify on-chain
     """
+    # Imported here so `--help` doesn't pay for web3/pydantic start-up
+    from blockchain import Web3Client, MysteryRegistrar, ConspiracyToMysteryConverter
     
-    logger.info("╔" + "="*58 + "╗")
-    logger.info("║" + " "*10 + "BLOCKCHAIN-ONLY TEST (DUMMY DATA)" + " "*14 + "║")
-    logger.info("╚" + "="*58 + "╝")
-    logger.info("")
+    if logger.isEnabledFor(logging.INFO):
+        logger.info(_BANNER_TOP)
+        logger.info(_BANNER_TITLE)
+        logger.info(_BANNER_BOTTOM)
+        logger.info("")
     
     # ========================================
     # STEP 1: CREATE DUMMY CONSPIRACY
     # ========================================
-    logger.info("="*60)
+    logger.info(_SEP)
     logger.info("STEP 1: CREATING DUMMY CONSPIRACY")
-    logger.info("="*60)
+    logger.info(_SEP)
     logger.info("")
     
     conspiracy = create_dummy_conspiracy()
@@ -132,9 +135,9 @@ async def test_blockchain_only(contract_address: str):
     # ========================================
     # STEP 2: CONVERT TO BLOCKCHAIN FORMAT
     # ========================================
-    logger.info("="*60)
+    logger.info(_SEP)
     logger.info("STEP 2: CONVERTING TO BLOCKCHAIN FORMAT")
-    logger.info("="*60)
+    logger.info(_SEP)
     logger.info("")
     
     try:
@@ -159,9 +162,9 @@ async def test_blockchain_only(contract_address: str):
     # ========================================
     # STEP 3: REGISTER ON BLOCKCHAIN
     # ========================================
-    logger.info("="*60)
+    logger.info(_SEP)
     logger.info("STEP 3: REGISTERING ON BLOCKCHAIN")
-    logger.info("="*60)
+    logger.info(_SEP)
     logger.info("")
     
     oracle_key = os.getenv("ORACLE_PRIVATE_KEY")
@@ -213,6 +216,8 @@ async def test_blockchain_only(contract_address: str):
         logger.info(f"   Mystery ID (bytes32): 0x{result['mystery_id_bytes32']}")
         logger.info("")
         
+        mystery_id_bytes = bytes.fromhex(result['mystery_id_bytes32'].removeprefix('0x'))
+        
     except Exception as e:
         logger.error(f"❌ Registration failed: {e}")
         import traceback
@@ -222,13 +227,13 @@ async def test_blockchain_only(contract_address: str):
     # ========================================
     # STEP 4: VERIFY ON-CHAIN
     # ========================================
-    logger.info("="*60)
+    logger.info(_SEP)
     logger.info("STEP 4: VERIFYING ON-CHAIN DATA")
-    logger.info("="*60)
+    logger.info(_SEP)
     logger.info("")
     
     try:
-        on_chain_data = await registrar.get_mystery_on_chain(mystery.metadata.mystery_id)
+        on_chain_data = await registrar.get_mystery_on_chain(mystery_id_bytes)
         
         if on_chain_data:
             logger.info("✅ MYSTERY FOUND ON-CHAIN")
@@ -253,9 +258,9 @@ async def test_blockchain_only(contract_address: str):
     # FINAL SUMMARY
     # ========================================
     logger.info("")
-    logger.info("="*60)
+    logger.info(_SEP)
     logger.info("✅ BLOCKCHAIN TEST COMPLETE")
-    logger.info("="*60)
+    logger.info(_SEP)
     logger.info("")
     logger.info("Summary:")
     logger.info(f"  Mystery ID: {mystery.metadata.mystery_id}")
@@ -2,13 +2,8 @@
 
 import asyncio
 import logging
-import sys
 import os
 
-# Add src to path (go up to backend, then into src)
-backend_dir = os.path.dirname(os.path.dirname(__file__))
-sys.path.insert(0, os.path.join(backend_dir, 'src'))
-
 from narrative.conspiracy import (
     PoliticalContextGenerator,
     ConspiracyGenerator,
@@ -26,13 +21,15 @@ logging.basicConfig(
 
 logger = logging.getLogger(__name__)
 
+_SEP = "=" * 60
+
 
 async def test_conspiracy_foundation():
     """Test the conspiracy foundation components."""
     
-    logger.info("="*60)
+    logger.info(_SEP)
     logger.info("TESTING CONSPIRACY MYSTERY FOUNDATION")
-    logger.info("="*60)
+    logger.info(_SEP)
     logger.info("")
     
     # Initialize LLM client
@@ -114,9 +111,9 @@ async def test_conspiracy_foundation():
         logger.info(f"      Conclusion: {sg.conclusion[:80]}...")
     
     logger.info("")
-    logger.info("="*60)
+    logger.info(_SEP)
     logger.info("✅ ALL FOUNDATION TESTS PASSED")
-    logger.info("="*60)
+    logger.info(_SEP)
 
 
 if __name__ == "__main__":
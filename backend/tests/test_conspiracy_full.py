@@ -2,13 +2,8 @@
 
 import asyncio
 import logging
-import sys
 import os
 
-# Add src to path
-backend_dir = os.path.dirname(os.path.dirname(__file__))
-sys.path.insert(0, os.path.join(backend_dir, 'src'))
-
 from narrative.conspiracy import ConspiracyPipeline
 from utils import CerebrasClient
 
@@ -5,10 +5,6 @@ import json
 from dotenv import load_dotenv
 load_dotenv()
 
-import sys
-backend_dir = os.path.dirname(os.path.dirname(__file__))
-sys.path.insert(0, os.path.join(backend_dir, 'src'))
-
 from arkiv_integration import ArkivClient
 
 async def discover_all_conspiracies():
@@ -1,17 +1,11 @@
 """Test document type diversity after fix."""
 
-import sys
-import os
-
-backend_dir = os.path.dirname(os.path.dirname(__file__))
-sys.path.insert(0, os.path.join(backend_dir, 'src'))
-
 from narrative.conspiracy.nodes.identity_nodes import IdentityNodeGenerator
 
-def test_document_type_diversity():
+def test_document_type_diversity(identity_generator):
     """Test that identity nodes now use diverse document types."""
     
-    generator = IdentityNodeGenerator()
+    generator = identity_generator
     
     print("\n" + "="*60)
     print("TESTING DOCUMENT TYPE DIVERSITY")
@@ -93,7 +87,7 @@ def test_document_type_diversity():
     print("\n" + "="*60)
 
 if __name__ == "__main__":
-    test_document_type_diversity()
+    test_document_type_diversity(IdentityNodeGenerator())
 
 
 
@@ -7,23 +7,25 @@ import asyncio
 import logging
 import sys
 import os
-import json
+import time
+from contextlib import AsyncExitStack
 from pathlib import Path
-from datetime import datetime
 
 from dotenv import load_dotenv
 load_dotenv()
 
-backend_dir = os.path.dirname(os.path.dirname(__file__))
-sys.path.insert(0, os.path.join(backend_dir, 'src'))
+ARKIV_RPC_URL = os.getenv("ARKIV_RPC_URL", "https://mendoza.hoodi.arkiv.network/rpc")
+ARKIV_WS_URL = os.getenv("ARKIV_WS_URL", "wss://mendoza.hoodi.arkiv.network/rpc/ws")
 
 from narrative.conspiracy import ConspiracyPipeline
-from utils import CerebrasClient
+from utils import CerebrasClient, dumps_json, loads_json
 from arkiv_integration import ArkivClient
 
 logging.basicConfig(level=logging.INFO, format='%(message)s')
 logger = logging.getLogger(__name__)
 
+_EXPIRES_WEEK = 604800  # 7 days, in seconds
+
 
 async def e2e_test(
     environment: str = "dev",  # "dev" or "prod"
@@ -41,15 +43,17 @@ async def e2e_test(
         conspiracy_type: "occult", "secret_society", or "underground_network"
     """
     
-    logger.info("="*60)
-    logger.info("🚀 END-TO-END CONSPIRACY PIPELINE TEST")
-    logger.info("="*60)
-    logger.info("")
-    logger.info(f"Environment: {environment.upper()}")
-    logger.info(f"Difficulty: {difficulty}/10")
-    logger.info(f"Documents: {num_documents}")
-    logger.info(f"Type: {conspiracy_type}")
-    logger.info("")
+    logger.info("\n".join([
+        "="*60,
+        "🚀 END-TO-END CONSPIRACY PIPELINE TEST",
+        "="*60,
+        "",
+        f"Environment: {environment.upper()}",
+        f"Difficulty: {difficulty}/10",
+        f"Documents: {num_documents}",
+        f"Type: {conspiracy_type}",
+        ""
+    ]))
     
     # Validate environment
     if environment not in ["dev", "prod"]:
@@ -93,7 +97,7 @@ async def e2e_test(
     pipeline = ConspiracyPipeline(llm, config, replicate_token=os.getenv("REPLICATE_API_TOKEN"))
     
     try:
-        start_time = datetime.now()
+        start_time = time.perf_counter()
         
         mystery = await pipeline.generate_conspiracy_mystery(
             difficulty=difficulty,
@@ -101,24 +105,22 @@ async def e2e_test(
             conspiracy_type=conspiracy_type
         )
         
-        generation_time = (datetime.now() - start_time).total_seconds()
+        generation_time = time.perf_counter() - start_time
         
         logger.info("")
         logger.info("✅ GENERATION COMPLETE")
-        logger.info(f"   Time: {generation_time:.1f}s")
-        logger.info(f"   Mystery: {mystery.premise.conspiracy_name}")
-        logger.info(f"   World: {mystery.political_context.world_name}")
-        logger.info(f"   Documents: {len(mystery.documents)}")
-        logger.info(f"   Sub-graphs: {len(mystery.subgraphs)}")
-        logger.info(f"   Characters: {len(mystery.characters)}")
-        logger.info(f"   Crypto keys: {len(mystery.crypto_keys)}")
-        logger.info(f"   Mystery ID: {mystery.mystery_id}")
+        logger.info("   Time: %.1fs", generation_time)
+        logger.info("   Mystery: %s", mystery.premise.conspiracy_name)
+        logger.info("   World: %s", mystery.political_context.world_name)
+        logger.info("   Documents: %s", len(mystery.documents))
+        logger.info("   Sub-graphs: %s", len(mystery.subgraphs))
+        logger.info("   Characters: %s", len(mystery.characters))
+        logger.info("   Crypto keys: %s", len(mystery.crypto_keys))
+        logger.info("   Mystery ID: %s", mystery.mystery_id)
         logger.info("")
         
     except Exception as e:
-        logger.error(f"❌ Generation failed: {e}")
-        import traceback
-        traceback.print_exc()
+        logger.exception("❌ Generation failed: %s", e)
         return None
     
     if not upload_to_arkiv:
@@ -130,151 +132,162 @@ async def e2e_test(
             "uploaded": False
         }
     
-    # ========================================
-    # STEP 2: DEPLOY TO ARKIV
-    # ========================================
-    logger.info("="*60)
-    logger.info("STEP 2: DEPLOYING TO ARKIV")
-    logger.info("="*60)
-    logger.info("")
-    
-    try:
-        async with ArkivClient(
-            private_key=arkiv_key,
-            rpc_url=os.getenv("ARKIV_RPC_URL", "https://mendoza.hoodi.arkiv.network/rpc"),
-            ws_url=os.getenv("ARKIV_WS_URL", "wss://mendoza.hoodi.arkiv.network/rpc/ws")
-        ) as client:
-            
-            entities = []
+    # One Arkiv session serves both deployment and verification
+    async with AsyncExitStack() as stack:
+        try:
+            client = await stack.enter_async_context(ArkivClient(
+                private_key=arkiv_key,
+                rpc_url=ARKIV_RPC_URL,
+                ws_url=ARKIV_WS_URL
+            ))
+        except Exception as e:
+            logger.exception("❌ Arkiv deployment failed: %s", e)
+            return None
+        
+        # ========================================
+        # STEP 2: DEPLOY TO ARKIV
+        # ========================================
+        logger.info("="*60)
+        logger.info("STEP 2: DEPLOYING TO ARKIV")
+        logger.info("="*60)
+        logger.info("")
+        
+        try:
+            mystery_id = mystery.mystery_id
+            world_name = mystery.political_context.world_name
             
             # 1. CONSPIRACY METADATA (with environment tag)
-            metadata = {
-                "mystery_id": mystery.mystery_id,
-                "conspiracy_name": mystery.premise.conspiracy_name,
-                "world": mystery.political_context.world_name,
-                "difficulty": mystery.difficulty,
-                "total_documents": len(mystery.documents),
-                "created_at": mystery.created_at,
-                "environment": environment  # Store in payload too
-            }
-            
-            entities.append({
-                "payload": json.dumps(metadata).encode('utf-8'),
+            metadata_entity = {
+                "payload": dumps_json({
+                    "mystery_id": mystery_id,
+                    "conspiracy_name": mystery.premise.conspiracy_name,
+                    "world": world_name,
+                    "difficulty": mystery.difficulty,
+                    "total_documents": len(mystery.documents),
+                    "created_at": mystery.created_at,
+                    "environment": environment  # Store in payload too
+                }),
                 "content_type": "application/json",
                 "attributes": {
                     # SEMANTIC ATTRIBUTES
                     "resource_type": "conspiracy",
-                    "mystery_id": mystery.mystery_id,
-                    "world": mystery.political_context.world_name,
+                    "mystery_id": mystery_id,
+                    "world": world_name,
                     "difficulty": str(mystery.difficulty),
                     "conspiracy_type": mystery.premise.conspiracy_type,
                     "environment": environment,  # ✅ DEV or PROD TAG!
                     "status": "active"
                 },
-                "expires_in": 604800  # 7 days
-            })
+                "expires_in": _EXPIRES_WEEK
+            }
             
-            logger.info(f"   Metadata attributes:")
-            logger.info(f"      resource_type: conspiracy")
-            logger.info(f"      world: {mystery.political_context.world_name}")
-            logger.info(f"      difficulty: {mystery.difficulty}")
-            logger.info(f"      conspiracy_type: {mystery.premise.conspiracy_type}")
-            logger.info(f"      environment: {environment} ← FILTERABLE!")
-            logger.info(f"      status: active")
+            logger.info("   Metadata attributes:")
+            logger.info("      resource_type: conspiracy")
+            logger.info("      world: %s", world_name)
+            logger.info("      difficulty: %s", mystery.difficulty)
+            logger.info("      conspiracy_type: %s", mystery.premise.conspiracy_type)
+            logger.info("      environment: %s ← FILTERABLE!", environment)
+            logger.info("      status: active")
             logger.info("")
             
             # 2. DOCUMENTS
-            for doc in mystery.documents:
-                doc_data = {
-                    "document_id": doc.get("document_id"),
-                    "document_type": doc.get("document_type"),
-                    "fields": doc.get("fields", {})
-                }
-                
-                entities.append({
-                    "payload": json.dumps(doc_data).encode('utf-8'),
-                    "content_type": "application/json",
-                    "attributes": {
-                        "resource_type": "document",
-                        "mystery_id": mystery.mystery_id,
-                        "document_id": doc.get("document_id"),
-                        "doc_type": doc.get("document_type"),
-                        "world": mystery.political_context.world_name,
-                        "environment": environment  # ✅ Same tag on documents
-                    },
-                    "expires_in": 604800
-                })
+            # Attributes shared by every document entity
+            base_doc_attrs = {
+                "resource_type": "document",
+                "mystery_id": mystery_id,
+                "world": world_name,
+                "environment": environment  # ✅ Same tag on documents
+            }
             
-            # Push in batches
-            logger.info(f"   Pushing {len(entities)} entities...")
-            batch_size = 10
-            total_pushed = 0
+            def iter_entities():
+                """Yield entity specs lazily so payloads are serialized batch by batch."""
+                yield metadata_entity
+                for doc in mystery.documents:
+                    doc_id = doc.get("document_id")
+                    doc_type = doc.get("document_type")
+                    doc_data = {
+                        "document_id": doc_id,
+                        "document_type": doc_type,
+                        "fields": doc.get("fields", {})
+                    }
+                    
+                    yield {
+                        "payload": dumps_json(doc_data),
+                        "content_type": "application/json",
+                        "attributes": base_doc_attrs | {
+                            "document_id": doc_id,
+                            "doc_type": doc_type
+                        },
+                        "expires_in": _EXPIRES_WEEK
+                    }
             
-            upload_start = datetime.now()
+            # Push in concurrent batches, cut lazily from the generator; any
+            # failed batch aborts the rest and lands in the except below
+            expected_total = 1 + len(mystery.documents)
+            logger.info("   Pushing %s entities...", expected_total)
             
-            for i in range(0, len(entities), batch_size):
-                batch = entities[i:i+batch_size]
-                keys = await client.create_entities_batch(batch)
-                total_pushed += len(keys)
-                logger.info(f"      Batch {i//batch_size + 1}: {len(keys)} entities")
+            upload_start = time.perf_counter()
+            keys = await client.create_entities_batched(iter_entities(), batch_size=10)
+            total_pushed = len(keys)
+            upload_time = time.perf_counter() - upload_start
             
-            upload_time = (datetime.now() - upload_start).total_seconds()
+            if total_pushed != expected_total:
+                logger.error(
+                    "❌ Arkiv deployment incomplete: %s/%s entities pushed",
+                    total_pushed, expected_total
+                )
+                return None
             
             logger.info("")
             logger.info("✅ DEPLOYMENT COMPLETE")
-            logger.info(f"   Time: {upload_time:.1f}s")
-            logger.info(f"   Total entities: {total_pushed}")
-            logger.info(f"   - 1 conspiracy metadata")
-            logger.info(f"   - {len(mystery.documents)} documents")
+            logger.info("   Time: %.1fs", upload_time)
+            logger.info("   Total entities: %s", total_pushed)
+            logger.info("   - 1 conspiracy metadata")
+            logger.info("   - %s documents", len(mystery.documents))
             logger.info("")
-    
-    except Exception as e:
-        logger.error(f"❌ Arkiv deployment failed: {e}")
-        import traceback
-        traceback.print_exc()
-        return None
-    
-    # ========================================
-    # STEP 3: FETCH FROM ARKIV (Verification)
-    # ========================================
-    logger.info("="*60)
-    logger.info("STEP 3: FETCHING FROM ARKIV (Verification)")
-    logger.info("="*60)
-    logger.info("")
-    
-    try:
-        async with ArkivClient(
-            private_key=arkiv_key,
-            rpc_url=os.getenv("ARKIV_RPC_URL", "https://mendoza.hoodi.arkiv.network/rpc"),
-            ws_url=os.getenv("ARKIV_WS_URL", "wss://mendoza.hoodi.arkiv.network/rpc/ws")
-        ) as client:
-            
-            # Query 1: Get this specific mystery
-            logger.info(f"   Query 1: Fetching mystery {mystery.mystery_id[:16]}...")
-            query_string = f'mystery_id = "{mystery.mystery_id}"'
-            entities = await client.query_entities(query_string, limit=100)
+        
+        except Exception as e:
+            logger.exception("❌ Arkiv deployment failed: %s", e)
+            return None
+        
+        # ========================================
+        # STEP 3: FETCH FROM ARKIV (Verification)
+        # ========================================
+        logger.info("="*60)
+        logger.info("STEP 3: FETCHING FROM ARKIV (Verification)")
+        logger.info("="*60)
+        logger.info("")
+        
+        try:
+            # Query 1 (this mystery) and Query 2 (whole environment) are
+            # independent, so fetch them concurrently
+            logger.info("   Query 1: Fetching mystery %s...", mystery.mystery_id[:16])
+            logger.info("   Query 2: All %s conspiracies...", environment)
+            entities, env_entities = await client.query_entities_many(
+                [f'mystery_id = "{mystery.mystery_id}"', f'environment = "{environment}"'],
+                limit=100
+            )
             
-            logger.info(f"   ✅ Found {len(entities)} entities")
+            logger.info("   ✅ Query 1 found %s entities", len(entities))
             
-            # Separate by type
-            conspiracy = [e for e in entities if e.attributes.get("resource_type") == "conspiracy"]
-            documents = [e for e in entities if e.attributes.get("resource_type") == "document"]
+            # Separate by type (single pass)
+            by_type = {"conspiracy": [], "document": []}
+            for e in entities:
+                bucket = by_type.get(e.attributes.get("resource_type"))
+                if bucket is not None:
+                    bucket.append(e)
+            conspiracy, documents = by_type["conspiracy"], by_type["document"]
             
-            logger.info(f"      - 1 conspiracy metadata")
-            logger.info(f"      - {len(documents)} documents")
+            logger.info("      - 1 conspiracy metadata")
+            logger.info("      - %s documents", len(documents))
             logger.info("")
             
-            # Query 2: Get all conspiracies in this environment
-            logger.info(f"   Query 2: All {environment} conspiracies...")
-            query_string = f'environment = "{environment}"'
-            env_entities = await client.query_entities(query_string, limit=100)
-            
             env_conspiracies = [e for e in env_entities if e.attributes.get("resource_type") == "conspiracy"]
-            logger.info(f"   ✅ Found {len(env_conspiracies)} {environment} conspiracies total")
+            logger.info("   ✅ Query 2 found %s %s conspiracies total", len(env_conspiracies), environment)
             
             for i, entity in enumerate(env_conspiracies, 1):
-                data = json.loads(entity.payload.decode('utf-8'))
-                logger.info(f"      {i}. {data['conspiracy_name']} (diff: {data['difficulty']})")
+                data = loads_json(entity.payload)
+                logger.info("      %s. %s (diff: %s)", i, data['conspiracy_name'], data['difficulty'])
             
             logger.info("")
             
@@ -282,49 +295,49 @@ async def e2e_test(
             if conspiracy:
                 logger.info("   Query 3: Verifying attributes...")
                 c = conspiracy[0]
-                logger.info(f"   ✅ Attributes verified:")
-                logger.info(f"      resource_type: {c.attributes.get('resource_type')}")
-                logger.info(f"      environment: {c.attributes.get('environment')} ✓")
-                logger.info(f"      world: {c.attributes.get('world')}")
-                logger.info(f"      difficulty: {c.attributes.get('difficulty')}")
-                logger.info(f"      conspiracy_type: {c.attributes.get('conspiracy_type')}")
+                logger.info("   ✅ Attributes verified:")
+                logger.info("      resource_type: %s", c.attributes.get('resource_type'))
+                logger.info("      environment: %s ✓", c.attributes.get('environment'))
+                logger.info("      world: %s", c.attributes.get('world'))
+                logger.info("      difficulty: %s", c.attributes.get('difficulty'))
+                logger.info("      conspiracy_type: %s", c.attributes.get('conspiracy_type'))
                 logger.info("")
-    
-    except Exception as e:
-        logger.error(f"❌ Fetch verification failed: {e}")
-        import traceback
-        traceback.print_exc()
-        return None
+        
+        except Exception as e:
+            logger.exception("❌ Fetch verification failed: %s", e)
+            return None
     
     # ========================================
     # FINAL SUMMARY
     # ========================================
-    logger.info("="*60)
-    logger.info("✅ E2E TEST COMPLETE")
-    logger.info("="*60)
-    logger.info("")
-    logger.info("Summary:")
-    logger.info(f"  Mystery: {mystery.premise.conspiracy_name}")
-    logger.info(f"  Mystery ID: {mystery.mystery_id}")
-    logger.info(f"  Environment: {environment}")
-    logger.info(f"  World: {mystery.political_context.world_name}")
-    logger.info(f"  Difficulty: {mystery.difficulty}/10")
-    logger.info(f"  Type: {mystery.premise.conspiracy_type}")
-    logger.info(f"  Documents: {len(mystery.documents)}")
-    logger.info(f"  Generation time: {generation_time:.1f}s")
-    logger.info(f"  Upload time: {upload_time:.1f}s")
-    logger.info("")
-    logger.info("Frontend Queries:")
-    logger.info(f'  // Get all {environment} conspiracies')
-    logger.info(f'  query.where(eq("environment", "{environment}"))')
-    logger.info("")
-    logger.info(f'  // Get this specific mystery')
-    logger.info(f'  query.where(eq("mystery_id", "{mystery.mystery_id}"))')
-    logger.info("")
-    logger.info(f'  // Get {environment} conspiracies in this world')
-    logger.info(f'  query.where(eq("environment", "{environment}"))')
-    logger.info(f'       .where(eq("world", "{mystery.political_context.world_name}"))')
-    logger.info("")
+    logger.info("\n".join([
+        "="*60,
+        "✅ E2E TEST COMPLETE",
+        "="*60,
+        "",
+        "Summary:",
+        f"  Mystery: {mystery.premise.conspiracy_name}",
+        f"  Mystery ID: {mystery.mystery_id}",
+        f"  Environment: {environment}",
+        f"  World: {mystery.political_context.world_name}",
+        f"  Difficulty: {mystery.difficulty}/10",
+        f"  Type: {mystery.premise.conspiracy_type}",
+        f"  Documents: {len(mystery.documents)}",
+        f"  Generation time: {generation_time:.1f}s",
+        f"  Upload time: {upload_time:.1f}s",
+        "",
+        "Frontend Queries:",
+        f'  // Get all {environment} conspiracies',
+        f'  query.where(eq("environment", "{environment}"))',
+        "",
+        '  // Get this specific mystery',
+        f'  query.where(eq("mystery_id", "{mystery.mystery_id}"))',
+        "",
+        f'  // Get {environment} conspiracies in this world',
+        f'  query.where(eq("environment", "{environment}"))',
+        f'       .where(eq("world", "{mystery.political_context.world_name}"))',
+        ""
+    ]))
     
     return {
         "mystery_id": mystery.mystery_id,
@@ -0,0 +1,52 @@
+"""Test that the JSON payload codec round-trips entity data."""
+
+import json
+
+import pytest
+
+from utils import json_codec
+from utils.json_codec import dumps_json, loads_json
+
+
+SAMPLE_PAYLOADS = [
+    {
+        "mystery_id": "3f2a9c1e-0000-4000-8000-000000000000",
+        "conspiracy_name": "The Ashen Circle",
+        "difficulty": 6,
+        "total_documents": 20,
+        "environment": "dev",
+    },
+    {
+        "document_id": "doc_007",
+        "document_type": "email",
+        "fields": {"subject": "Re: café ☕ — ünïcödé", "cc": [], "urgent": True, "score": 0.5},
+    },
+    [1, "two", None, {"nested": [False]}],
+]
+
+
+@pytest.mark.parametrize("payload", SAMPLE_PAYLOADS)
+def test_round_trip(payload):
+    """dumps_json output decodes back to the original object."""
+    encoded = dumps_json(payload)
+
+    assert isinstance(encoded, bytes)
+    assert loads_json(encoded) == payload
+
+
+@pytest.mark.parametrize("payload", SAMPLE_PAYLOADS)
+def test_loads_accepts_str(payload):
+    """loads_json takes str as well as bytes (e.g. payloads read from disk)."""
+    assert loads_json(dumps_json(payload).decode("utf-8")) == payload
+
+
+@pytest.mark.parametrize("payload", SAMPLE_PAYLOADS)
+def test_stdlib_fallback_matches(monkeypatch, payload):
+    """Without orjson the codec still emits JSON the stdlib decoder agrees with."""
+    monkeypatch.setattr(json_codec, "orjson", None)
+
+    encoded = dumps_json(payload)
+
+    assert isinstance(encoded, bytes)
+    assert json.loads(encoded) == payload
+    assert loads_json(encoded) == payload
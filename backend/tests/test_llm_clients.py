@@ -3,10 +3,6 @@
 
 import asyncio
 import sys
-from pathlib import Path
-
-# Add src to path
-sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
 
 from utils import load_config, setup_logger, CerebrasClient, OpenAIClient
 
@@ -27,22 +23,22 @@ async def test_cerebras():
     try:
         client = CerebrasClient(config.cerebras_api_key)
         
-        # Test simple generation
+        # Test simple and JSON generation (independent requests, run concurrently)
         logger.info("Test 1: Simple text generation...")
-        response = await client.generate(
-            "Say 'Hello from Cerebras!' in exactly 5 words.",
-            temperature=0.7,
-            max_tokens=100  # Increased from 20 to avoid truncation
+        logger.info("Test 2: JSON generation...")
+        response, json_response = await asyncio.gather(
+            client.generate(
+                "Say 'Hello from Cerebras!' in exactly 5 words.",
+                temperature=0.7,
+                max_tokens=100  # Increased from 20 to avoid truncation
+            ),
+            client.generate_json(
+                "Generate a JSON object with 'name' and 'age' fields for a fictional character.",
+                temperature=0.7,
+                max_tokens=200  # Increased from 100
+            )
         )
         logger.info(f"✅ Response: {response}")
-        
-        # Test JSON generation
-        logger.info("\nTest 2: JSON generation...")
-        json_response = await client.generate_json(
-            "Generate a JSON object with 'name' and 'age' fields for a fictional character.",
-            temperature=0.7,
-            max_tokens=200  # Increased from 100
-        )
         logger.info(f"✅ JSON: {json_response}")
         
         logger.info("\n✅ All Cerebras tests passed!")
@@ -92,9 +88,9 @@ async def main():
     print("🧪 LLM Clients Test Suite")
     print("="*60)
     
-    cerebras_pass = await test_cerebras()
-    print()
-    openai_pass = await test_openai()
+    # Independent services, so run both suites concurrently
+    results = await asyncio.gather(test_cerebras(), test_openai(), return_exceptions=True)
+    cerebras_pass, openai_pass = (r is True for r in results)
     
     print("\n" + "="*60)
     print("📊 Test Summary")
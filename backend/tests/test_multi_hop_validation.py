@@ -3,12 +3,9 @@
 
 import asyncio
 import logging
-import sys
 import os
 from pathlib import Path
 
-sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
-
 from utils import CerebrasClient
 from validation.conspiracy_validator import ConspiracyValidator
 import json
@@ -1,11 +1,7 @@
 """Test that narrative documents don't have technical log contamination."""
 
-import sys
 import json
-import os
 
-backend_dir = os.path.dirname(os.path.dirname(__file__))
-sys.path.insert(0, os.path.join(backend_dir, 'src'))
 
 def test_document_contamination():
     """Check recent generated documents for contamination."""
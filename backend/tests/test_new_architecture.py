@@ -12,12 +12,6 @@ This test verifies:
 import asyncio
 import sys
 import json
-from pathlib import Path
-
-# Add backend to path
-backend_path = Path(__file__).parent
-sys.path.insert(0, str(backend_path))
-sys.path.insert(0, str(backend_path / "src"))
 
 from narrative.conspiracy.conspiracy_pipeline import ConspiracyPipeline
 from utils.llm_clients import CerebrasClient
@@ -0,0 +1,71 @@
+"""Test that pipeline image generation keeps clue order and skips failures."""
+
+import asyncio
+from types import SimpleNamespace
+from unittest.mock import AsyncMock
+
+import pytest
+
+from narrative.conspiracy.conspiracy_pipeline import ConspiracyPipeline
+
+
+def _pipeline(generate_image, config=None):
+    """Pipeline with only what _generate_images needs (no LLM clients)."""
+    pipeline = ConspiracyPipeline.__new__(ConspiracyPipeline)
+    pipeline.config = config or {}
+    pipeline.image_generator = SimpleNamespace(generate_image=generate_image)
+    return pipeline
+
+
+def _clues(count):
+    return [SimpleNamespace(image_id=f"img_{i}", prompt=f"prompt {i}") for i in range(count)]
+
+
+@pytest.fixture(autouse=True)
+def _isolated_outputs(tmp_path, monkeypatch):
+    """_generate_images writes under outputs/ relative to the working directory."""
+    monkeypatch.chdir(tmp_path)
+
+
+def test_results_keep_clue_order_and_skip_failures():
+    """Images come back in clue order; failed or empty generations are dropped."""
+
+    async def generate_image(prompt, image_id, output_dir):
+        index = int(image_id.split("_")[1])
+        await asyncio.sleep((7 - index) / 1000)  # later clues finish first
+        if index == 2:
+            raise RuntimeError("replicate error")
+        if index == 4:
+            return None
+        return {"image_id": image_id}
+
+    pipeline = _pipeline(AsyncMock(side_effect=generate_image))
+
+    images = asyncio.run(pipeline._generate_images(_clues(7), premise=None))
+
+    assert [img["image_id"] for img in images] == ["img_0", "img_1", "img_3", "img_5", "img_6"]
+    assert pipeline.image_generator.generate_image.await_count == 7
+
+
+def test_concurrency_follows_image_generation_batch_size():
+    """At most image_generation.parallel_batch_size images are generated at once."""
+    in_flight = 0
+    peak = 0
+
+    async def generate_image(prompt, image_id, output_dir):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.005)
+        in_flight -= 1
+        return {"image_id": image_id}
+
+    pipeline = _pipeline(
+        AsyncMock(side_effect=generate_image),
+        config={"image_generation": {"parallel_batch_size": 2}}
+    )
+
+    images = asyncio.run(pipeline._generate_images(_clues(5), premise=None))
+
+    assert len(images) == 5
+    assert peak == 2
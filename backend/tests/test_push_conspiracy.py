@@ -2,20 +2,18 @@
 
 import asyncio
 import logging
-import sys
 import os
-import json
 from pathlib import Path
 
 # Load .env file
 from dotenv import load_dotenv
 load_dotenv()
 
-backend_dir = os.path.dirname(os.path.dirname(__file__))
-sys.path.insert(0, os.path.join(backend_dir, 'src'))
+ARKIV_RPC_URL = os.getenv("ARKIV_RPC_URL", "https://kaolin.hoodi.arkiv.network/rpc")
+ARKIV_WS_URL = os.getenv("ARKIV_WS_URL", "wss://kaolin.hoodi.arkiv.network/rpc/ws")
 
 from narrative.conspiracy import ConspiracyPipeline
-from utils import CerebrasClient
+from utils import CerebrasClient, AsyncRateLimiter, dumps_json
 from arkiv_integration import ArkivClient
 
 logging.basicConfig(level=logging.INFO, format='%(message)s')
@@ -33,12 +31,13 @@ async def generate_and_push(environment: str = "dev"):
     logger.info("="*60)
     logger.info("GENERATE CONSPIRACY + PUSH DOCUMENTS")
     logger.info("="*60)
-    logger.info(f"Environment: {environment.upper()}")
+    logger.info("Environment: %s", environment.upper())
     logger.info("")
     
     # Check keys
     cerebras_key = os.getenv("CEREBRAS_API_KEY")
     arkiv_key = os.getenv("ARKIV_PRIVATE_KEY")
+    replicate_token = os.getenv("REPLICATE_API_TOKEN")
     
     if not cerebras_key:
         logger.error("❌ CEREBRAS_API_KEY required")
@@ -59,7 +58,7 @@ async def generate_and_push(environment: str = "dev"):
         "num_images": 2
     }
     
-    pipeline = ConspiracyPipeline(llm, config, replicate_token=os.getenv("REPLICATE_API_TOKEN"))
+    pipeline = ConspiracyPipeline(llm, config, replicate_token=replicate_token)
     
     try:
         mystery = await pipeline.generate_conspiracy_mystery(
@@ -69,13 +68,13 @@ async def generate_and_push(environment: str = "dev"):
         )
         
         logger.info("")
-        logger.info(f"✅ Generated: {mystery.premise.conspiracy_name}")
-        logger.info(f"   Documents: {len(mystery.documents)}")
-        logger.info(f"   Mystery ID: {mystery.mystery_id}")
+        logger.info("✅ Generated: %s", mystery.premise.conspiracy_name)
+        logger.info("   Documents: %s", len(mystery.documents))
+        logger.info("   Mystery ID: %s", mystery.mystery_id)
         logger.info("")
         
     except Exception as e:
-        logger.error(f"❌ Generation failed: {e}")
+        logger.error("❌ Generation failed: %s", e)
         return
     
     # Step 2: Push to Arkiv (if key available)
@@ -89,13 +88,11 @@ async def generate_and_push(environment: str = "dev"):
     try:
         async with ArkivClient(
             private_key=arkiv_key,
-            rpc_url=os.getenv("ARKIV_RPC_URL", "https://kaolin.hoodi.arkiv.network/rpc"),
-            ws_url=os.getenv("ARKIV_WS_URL", "wss://kaolin.hoodi.arkiv.network/rpc/ws")
+            rpc_url=ARKIV_RPC_URL,
+            ws_url=ARKIV_WS_URL
         ) as client:
             
             # Build entities for documents
-            entities = []
-            
             # 1. Metadata entity (with semantic attributes)
             metadata = {
                 "mystery_id": mystery.mystery_id,
@@ -106,8 +103,8 @@ async def generate_and_push(environment: str = "dev"):
                 "created_at": mystery.created_at
             }
             
-            entities.append({
-                "payload": json.dumps(metadata).encode('utf-8'),
+            metadata_entity = {
+                "payload": dumps_json(metadata),
                 "content_type": "application/json",
                 "attributes": {
                     # ✅ SEMANTIC ATTRIBUTES (meaningful, filterable)
@@ -120,49 +117,49 @@ async def generate_and_push(environment: str = "dev"):
                     "status": "active"
                 },
                 "expires_in": 604800  # 7 days
-            })
+            }
             
             # 2. Document entities (with semantic attributes)
-            for doc in mystery.documents:
-                doc_data = {
-                    "document_id": doc.get("document_id"),
-                    "document_type": doc.get("document_type"),
-                    "fields": doc.get("fields", {})
-                }
-                
-                entities.append({
-                    "payload": json.dumps(doc_data).encode('utf-8'),
+            # ✅ SEMANTIC ATTRIBUTES shared by every document (meaningful, filterable)
+            base_doc_attrs = {
+                "resource_type": "document",  # Clear purpose!
+                "mystery_id": mystery.mystery_id,
+                "world": mystery.political_context.world_name,
+                "environment": environment  # dev or prod
+            }
+            
+            doc_entities = [
+                {
+                    "payload": dumps_json({
+                        "document_id": doc.get("document_id"),
+                        "document_type": doc.get("document_type"),
+                        "fields": doc.get("fields", {})
+                    }),
                     "content_type": "application/json",
-                    "attributes": {
-                        # ✅ SEMANTIC ATTRIBUTES (meaningful, filterable)
-                        "resource_type": "document",  # Clear purpose!
-                        "mystery_id": mystery.mystery_id,
+                    "attributes": base_doc_attrs | {
                         "document_id": doc.get("document_id"),
-                        "doc_type": doc.get("document_type"),  # Filterable by type!
-                        "world": mystery.political_context.world_name,
-                        "environment": environment  # dev or prod
+                        "doc_type": doc.get("document_type")  # Filterable by type!
                     },
                     "expires_in": 604800
-                })
-            
-            # Push in batches
-            batch_size = 10
-            total_pushed = 0
+                }
+                for doc in mystery.documents
+            ]
+            entities = [metadata_entity, *doc_entities]
             
-            for i in range(0, len(entities), batch_size):
-                batch = entities[i:i+batch_size]
-                keys = await client.create_entities_batch(batch)
-                total_pushed += len(keys)
-                logger.info(f"   ✅ Batch {i//batch_size + 1}: {len(keys)} entities")
+            # Push in concurrent batches, pacing the transactions
+            keys = await client.create_entities_batched(
+                entities,
+                batch_size=50,
+                rate_limiter=AsyncRateLimiter(max_rate=20, time_period=1)
+            )
+            total_pushed = len(keys)
             
             logger.info("")
-            logger.info(f"✅ Pushed {total_pushed} entities to Arkiv")
+            logger.info("✅ Pushed %s entities to Arkiv", total_pushed)
             logger.info("")
         
     except Exception as e:
-        logger.error(f"❌ Arkiv push failed: {e}")
-        import traceback
-        traceback.print_exc()
+        logger.exception("❌ Arkiv push failed: %s", e)
         return
     
     logger.info("="*60)
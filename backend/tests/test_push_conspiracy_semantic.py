@@ -2,36 +2,34 @@
 
 import asyncio
 import logging
-import sys
 import os
-import json
 from pathlib import Path
 
 from dotenv import load_dotenv
 load_dotenv()
 
-backend_dir = os.path.dirname(os.path.dirname(__file__))
-sys.path.insert(0, os.path.join(backend_dir, 'src'))
+ARKIV_RPC_URL = os.getenv("ARKIV_RPC_URL", "https://mendoza.hoodi.arkiv.network/rpc")
+ARKIV_WS_URL = os.getenv("ARKIV_WS_URL", "wss://mendoza.hoodi.arkiv.network/rpc/ws")
 
 from narrative.conspiracy import ConspiracyPipeline
-from utils import CerebrasClient
+from utils import CerebrasClient, dumps_json
 from arkiv_integration import ArkivClient
 
 logging.basicConfig(level=logging.INFO, format='%(message)s')
 logger = logging.getLogger(__name__)
 
+_SEP = "=" * 60
+
 
 async def generate_and_push():
     """Generate conspiracy and push with semantic, queryable attributes."""
     
-    logger.info("="*60)
-    logger.info("GENERATE + PUSH WITH SEMANTIC ATTRIBUTES")
-    logger.info("="*60)
-    logger.info("")
+    logger.info("\n".join([_SEP, "GENERATE + PUSH WITH SEMANTIC ATTRIBUTES", _SEP, ""]))
     
     # Check keys
     cerebras_key = os.getenv("CEREBRAS_API_KEY")
     arkiv_key = os.getenv("ARKIV_PRIVATE_KEY")
+    replicate_token = os.getenv("REPLICATE_API_TOKEN")
     
     if not cerebras_key:
         logger.error("❌ CEREBRAS_API_KEY required")
@@ -52,7 +50,7 @@ async def generate_and_push():
         "num_images": 2
     }
     
-    pipeline = ConspiracyPipeline(llm, config, replicate_token=os.getenv("REPLICATE_API_TOKEN"))
+    pipeline = ConspiracyPipeline(llm, config, replicate_token=replicate_token)
     
     try:
         mystery = await pipeline.generate_conspiracy_mystery(
@@ -61,11 +59,13 @@ async def generate_and_push():
             conspiracy_type="occult"
         )
         
-        logger.info("")
-        logger.info(f"✅ Generated: {mystery.premise.conspiracy_name}")
-        logger.info(f"   Documents: {len(mystery.documents)}")
-        logger.info(f"   Mystery ID: {mystery.mystery_id}")
-        logger.info("")
+        logger.info("\n".join([
+            "",
+            f"✅ Generated: {mystery.premise.conspiracy_name}",
+            f"   Documents: {len(mystery.documents)}",
+            f"   Mystery ID: {mystery.mystery_id}",
+            ""
+        ]))
         
     except Exception as e:
         logger.error(f"❌ Generation failed: {e}")
@@ -82,33 +82,35 @@ async def generate_and_push():
     try:
         async with ArkivClient(
             private_key=arkiv_key,
-            rpc_url=os.getenv("ARKIV_RPC_URL", "https://mendoza.hoodi.arkiv.network/rpc"),
-            ws_url=os.getenv("ARKIV_WS_URL", "wss://mendoza.hoodi.arkiv.network/rpc/ws")
+            rpc_url=ARKIV_RPC_URL,
+            ws_url=ARKIV_WS_URL
         ) as client:
             
             # Build entities with SEMANTIC attributes
             entities = []
+            mystery_id = mystery.mystery_id
+            world_name = mystery.political_context.world_name
             
             # ========================================
             # 1. CONSPIRACY METADATA (Discoverable!)
             # ========================================
             metadata = {
-                "mystery_id": mystery.mystery_id,
+                "mystery_id": mystery_id,
                 "conspiracy_name": mystery.premise.conspiracy_name,
-                "world": mystery.political_context.world_name,
+                "world": world_name,
                 "difficulty": mystery.difficulty,
                 "total_documents": len(mystery.documents),
                 "created_at": mystery.created_at
             }
             
             entities.append({
-                "payload": json.dumps(metadata).encode('utf-8'),
+                "payload": dumps_json(metadata),
                 "content_type": "application/json",
                 "attributes": {
                     # ✅ SEMANTIC ATTRIBUTES (Meaningful & Queryable)
                     "resource_type": "conspiracy",  # Clear purpose!
-                    "mystery_id": mystery.mystery_id,
-                    "world": mystery.political_context.world_name,  # Filter by world
+                    "mystery_id": mystery_id,
+                    "world": world_name,  # Filter by world
                     "difficulty": str(mystery.difficulty),  # Filter by difficulty
                     "conspiracy_type": "occult",  # Filter by theme
                     "status": "active",  # Filter by state
@@ -117,92 +119,93 @@ async def generate_and_push():
                 "expires_in": 604800  # 7 days
             })
             
-            logger.info("   Metadata attributes:")
-            logger.info("      ✅ resource_type = 'conspiracy' (semantic!)")
-            logger.info("      ✅ world (filterable)")
-            logger.info("      ✅ difficulty (filterable)")
-            logger.info("      ✅ conspiracy_type (filterable)")
-            logger.info("      ✅ status (filterable)")
-            logger.info("")
+            logger.info("\n".join([
+                "   Metadata attributes:",
+                "      ✅ resource_type = 'conspiracy' (semantic!)",
+                "      ✅ world (filterable)",
+                "      ✅ difficulty (filterable)",
+                "      ✅ conspiracy_type (filterable)",
+                "      ✅ status (filterable)",
+                ""
+            ]))
             
             # ========================================
             # 2. DOCUMENTS (Filterable by type!)
             # ========================================
-            for doc in mystery.documents:
-                doc_data = {
-                    "document_id": doc.get("document_id"),
-                    "document_type": doc.get("document_type"),
-                    "fields": doc.get("fields", {})
-                }
-                
-                entities.append({
-                    "payload": json.dumps(doc_data).encode('utf-8'),
+            # ✅ SEMANTIC ATTRIBUTES shared by every document
+            base_doc_attrs = {
+                "resource_type": "document",  # Clear purpose!
+                "mystery_id": mystery_id,
+                "world": world_name  # Same world as mystery
+            }
+            
+            entities.extend([
+                {
+                    "payload": dumps_json({
+                        "document_id": doc.get("document_id"),
+                        "document_type": doc.get("document_type"),
+                        "fields": doc.get("fields", {})
+                    }),
                     "content_type": "application/json",
-                    "attributes": {
-                        # ✅ SEMANTIC ATTRIBUTES
-                        "resource_type": "document",  # Clear purpose!
-                        "mystery_id": mystery.mystery_id,
+                    "attributes": base_doc_attrs | {
                         "document_id": doc.get("document_id"),
-                        "doc_type": doc.get("document_type"),  # Filter by type (email, log, etc.)
-                        "world": mystery.political_context.world_name  # Same world as mystery
+                        "doc_type": doc.get("document_type")  # Filter by type (email, log, etc.)
                     },
                     "expires_in": 604800
-                })
-            
-            logger.info(f"   Document attributes (x{len(mystery.documents)}):")
-            logger.info("      ✅ resource_type = 'document' (semantic!)")
-            logger.info("      ✅ doc_type = 'email' | 'network_log' | etc. (filterable!)")
-            logger.info("      ✅ world (same as mystery)")
-            logger.info("")
+                }
+                for doc in mystery.documents
+            ])
             
-            # Push in batches
-            batch_size = 10
-            total_pushed = 0
+            logger.info("\n".join([
+                f"   Document attributes (x{len(mystery.documents)}):",
+                "      ✅ resource_type = 'document' (semantic!)",
+                "      ✅ doc_type = 'email' | 'network_log' | etc. (filterable!)",
+                "      ✅ world (same as mystery)",
+                ""
+            ]))
             
-            for i in range(0, len(entities), batch_size):
-                batch = entities[i:i+batch_size]
-                keys = await client.create_entities_batch(batch)
-                total_pushed += len(keys)
-                logger.info(f"   ✅ Batch {i//batch_size + 1}: {len(keys)} entities")
+            # Push in concurrent batches
+            keys = await client.create_entities_batched(entities, batch_size=10)
+            total_pushed = len(keys)
             
-            logger.info("")
-            logger.info(f"✅ Pushed {total_pushed} entities to Arkiv")
-            logger.info("")
+            logger.info("\n".join([
+                "",
+                f"✅ Pushed {total_pushed} entities to Arkiv",
+                ""
+            ]))
             
             # ========================================
             # 3. SHOW NEW QUERY EXAMPLES
             # ========================================
-            logger.info("="*60)
-            logger.info("✨ NEW SEMANTIC QUERIES")
-            logger.info("="*60)
-            logger.info("")
-            logger.info("// Discover all conspiracies")
-            logger.info('query.where(eq("resource_type", "conspiracy"))')
-            logger.info("")
-            logger.info("// Filter by world")
-            logger.info(f'query.where(eq("world", "{mystery.political_context.world_name}"))')
-            logger.info("")
-            logger.info("// Filter by difficulty")
-            logger.info('query.where(eq("difficulty", "6"))')
-            logger.info("")
-            logger.info("// Get all emails for a mystery")
-            logger.info('query.where(eq("mystery_id", "..."))')
-            logger.info('     .where(eq("doc_type", "email"))')
-            logger.info("")
-            logger.info("// Get all documents in a world")
-            logger.info(f'query.where(eq("world", "{mystery.political_context.world_name}"))')
-            logger.info('     .where(eq("resource_type", "document"))')
-            logger.info("")
+            logger.info("\n".join([
+                _SEP,
+                "✨ NEW SEMANTIC QUERIES",
+                _SEP,
+                "",
+                "// Discover all conspiracies",
+                'query.where(eq("resource_type", "conspiracy"))',
+                "",
+                "// Filter by world",
+                f'query.where(eq("world", "{world_name}"))',
+                "",
+                "// Filter by difficulty",
+                'query.where(eq("difficulty", "6"))',
+                "",
+                "// Get all emails for a mystery",
+                'query.where(eq("mystery_id", "..."))',
+                '     .where(eq("doc_type", "email"))',
+                "",
+                "// Get all documents in a world",
+                f'query.where(eq("world", "{world_name}"))',
+                '     .where(eq("resource_type", "document"))',
+                ""
+            ]))
         
     except Exception as e:
-        logger.error(f"❌ Arkiv push failed: {e}")
-        import traceback
-        traceback.print_exc()
+        logger.exception("❌ Arkiv push failed: %s", e)
         return
     
-    logger.info("="*60)
-    logger.info("🎉 COMPLETE WITH SEMANTIC ATTRIBUTES")
-    logger.info("="*60)
+    logger.info("\n".join([_SEP, "🎉 COMPLETE WITH SEMANTIC ATTRIBUTES", _SEP]))
 
 
 if __name__ == "__main__":
@@ -4,28 +4,29 @@ import asyncio
 import logging
 import sys
 import os
-import json
+
+import aiofiles
 
 # Load .env file
 from dotenv import load_dotenv
 load_dotenv()
 
-backend_dir = os.path.dirname(os.path.dirname(__file__))
-sys.path.insert(0, os.path.join(backend_dir, 'src'))
+ARKIV_RPC_URL = os.getenv("ARKIV_RPC_URL", "https://mendoza.hoodi.arkiv.network/rpc")
+ARKIV_WS_URL = os.getenv("ARKIV_WS_URL", "wss://mendoza.hoodi.arkiv.network/rpc/ws")
 
 from arkiv_integration import ArkivClient
+from utils import loads_json
 
 logging.basicConfig(level=logging.INFO, format='%(message)s')
 logger = logging.getLogger(__name__)
 
+_SEP = "=" * 60
+
 
 async def query_mystery_from_arkiv(mystery_id: str = None):
     """Query and display mystery from Arkiv."""
     
-    logger.info("="*60)
-    logger.info("QUERY CONSPIRACY FROM ARKIV")
-    logger.info("="*60)
-    logger.info("")
+    logger.info("\n".join([_SEP, "QUERY CONSPIRACY FROM ARKIV", _SEP, ""]))
     
     # Check key
     arkiv_key = os.getenv("ARKIV_PRIVATE_KEY")
@@ -37,15 +38,18 @@ async def query_mystery_from_arkiv(mystery_id: str = None):
     if not mystery_id:
         from pathlib import Path
         conspiracies_dir = Path("outputs/conspiracies")
-        mystery_dirs = sorted([d for d in conspiracies_dir.iterdir() if d.is_dir()],
-                             key=lambda x: x.stat().st_mtime, reverse=True)
+        # Single pass over cached DirEntry stats; max() picks the newest directory
+        with os.scandir(conspiracies_dir) as it:
+            mystery_dirs = [(e.stat().st_mtime, e.path) for e in it if e.is_dir()]
         
         if mystery_dirs:
-            mystery_file = mystery_dirs[0] / "mystery.json"
-            with open(mystery_file) as f:
-                data = json.load(f)
-                mystery_id = data['mystery_id']
-                logger.info(f"📂 Using latest local mystery: {mystery_dirs[0].name}")
+            latest_dir = Path(max(mystery_dirs)[1])
+            mystery_file = latest_dir / "mystery.json"
+            # Read without blocking the event loop
+            async with aiofiles.open(mystery_file, 'rb') as f:
+                data = loads_json(await f.read())
+            mystery_id = data['mystery_id']
+            logger.info(f"📂 Using latest local mystery: {latest_dir.name}")
         else:
             logger.error("❌ No mystery_id provided and no local mysteries found")
             return
@@ -56,8 +60,8 @@ async def query_mystery_from_arkiv(mystery_id: str = None):
     try:
         async with ArkivClient(
             private_key=arkiv_key,
-            rpc_url=os.getenv("ARKIV_RPC_URL", "https://mendoza.hoodi.arkiv.network/rpc"),
-            ws_url=os.getenv("ARKIV_WS_URL", "wss://mendoza.hoodi.arkiv.network/rpc/ws")
+            rpc_url=ARKIV_RPC_URL,
+            ws_url=ARKIV_WS_URL
         ) as client:
             
             # Query all entities for this mystery
@@ -75,9 +79,11 @@ async def query_mystery_from_arkiv(mystery_id: str = None):
             logger.info("")
             
             # Separate by entity type
+            # Documents are only counted, except the first 3 kept for the preview
             metadata_entities = []
-            document_entities = []
+            doc_preview = []
             image_entities = []
+            num_documents = 0
             
             for entity in entities:
                 resource_type = entity.attributes.get("resource_type", "unknown")
@@ -85,65 +91,66 @@ async def query_mystery_from_arkiv(mystery_id: str = None):
                 if resource_type == "conspiracy":
                     metadata_entities.append(entity)
                 elif resource_type == "document":
-                    document_entities.append(entity)
+                    num_documents += 1
+                    if len(doc_preview) < 3:
+                        doc_preview.append(entity)
                 elif resource_type == "image":
                     image_entities.append(entity)
             
-            logger.info("="*60)
-            logger.info("ENTITY BREAKDOWN")
-            logger.info("="*60)
-            logger.info(f"Metadata: {len(metadata_entities)}")
-            logger.info(f"Documents: {len(document_entities)}")
-            logger.info(f"Images: {len(image_entities)}")
-            logger.info("")
+            logger.info("\n".join([
+                _SEP,
+                "ENTITY BREAKDOWN",
+                _SEP,
+                f"Metadata: {len(metadata_entities)}",
+                f"Documents: {num_documents}",
+                f"Images: {len(image_entities)}",
+                ""
+            ]))
             
             # Display metadata
             if metadata_entities:
-                logger.info("="*60)
-                logger.info("METADATA")
-                logger.info("="*60)
+                logger.info("\n".join([_SEP, "METADATA", _SEP]))
                 
                 for meta in metadata_entities:
-                    data = json.loads(meta.payload.decode('utf-8'))
-                    logger.info(f"Conspiracy: {data.get('conspiracy_name')}")
-                    logger.info(f"World: {data.get('world')}")
-                    logger.info(f"Difficulty: {data.get('difficulty')}/10")
-                    logger.info(f"Total Documents: {data.get('total_documents')}")
-                    logger.info(f"Created: {data.get('created_at')}")
-                    logger.info("")
+                    data = loads_json(meta.payload)
+                    logger.info("\n".join([
+                        f"Conspiracy: {data.get('conspiracy_name')}",
+                        f"World: {data.get('world')}",
+                        f"Difficulty: {data.get('difficulty')}/10",
+                        f"Total Documents: {data.get('total_documents')}",
+                        f"Created: {data.get('created_at')}",
+                        ""
+                    ]))
             
             # Display sample documents
-            if document_entities:
-                logger.info("="*60)
-                logger.info("SAMPLE DOCUMENTS (first 3)")
-                logger.info("="*60)
+            if doc_preview:
+                logger.info("\n".join([_SEP, "SAMPLE DOCUMENTS (first 3)", _SEP]))
                 
-                for i, doc_entity in enumerate(document_entities[:3], 1):
-                    doc_data = json.loads(doc_entity.payload.decode('utf-8'))
+                for i, doc_entity in enumerate(doc_preview, 1):
+                    doc_data = loads_json(doc_entity.payload)
+                    fields = doc_data.get('fields', {})
                     
-                    logger.info(f"\n{i}. {doc_data.get('document_id')}")
-                    logger.info(f"   Type: {doc_data.get('document_type')}")
-                    logger.info(f"   Fields: {list(doc_data.get('fields', {}).keys())}")
+                    logger.info("\n".join([
+                        f"\n{i}. {doc_data.get('document_id')}",
+                        f"   Type: {doc_data.get('document_type')}",
+                        f"   Fields: {list(fields)}"
+                    ]))
                     
-                    # Show a sample field
-                    fields = doc_data.get('fields', {})
+                    # Show a sample field (truncated for display)
                     if fields:
-                        first_field = list(fields.keys())[0]
-                        value = fields[first_field]
+                        first_field, value = next(iter(fields.items()))
                         if isinstance(value, str) and len(value) > 100:
                             value = value[:100] + "..."
                         logger.info(f"   {first_field}: {value}")
                 
                 logger.info("")
-                if len(document_entities) > 3:
-                    logger.info(f"   ... and {len(document_entities) - 3} more documents")
+                if num_documents > 3:
+                    logger.info(f"   ... and {num_documents - 3} more documents")
                 logger.info("")
             
             # Display images
             if image_entities:
-                logger.info("="*60)
-                logger.info("IMAGES")
-                logger.info("="*60)
+                logger.info("\n".join([_SEP, "IMAGES", _SEP]))
                 
                 for img_entity in image_entities:
                     img_size = len(img_entity.payload)
@@ -152,30 +159,28 @@ async def query_mystery_from_arkiv(mystery_id: str = None):
                 
                 logger.info("")
             
-            logger.info("="*60)
-            logger.info("✅ QUERY COMPLETE")
-            logger.info("="*60)
-            logger.info("")
-            logger.info("Query results:")
-            logger.info(f"  - Mystery ID: {mystery_id}")
-            logger.info(f"  - Total entities: {len(entities)}")
-            logger.info(f"  - Documents: {len(document_entities)}")
-            logger.info(f"  - Images: {len(image_entities)}")
-            logger.info("")
-            logger.info("Frontend can query with:")
-            logger.info(f'  query: mystery_id = "{mystery_id}"')
-            logger.info(f'  or: mystery_id = "{mystery_id}" and entity_type = "document"')
-            logger.info("")
+            logger.info("\n".join([
+                _SEP,
+                "✅ QUERY COMPLETE",
+                _SEP,
+                "",
+                "Query results:",
+                f"  - Mystery ID: {mystery_id}",
+                f"  - Total entities: {len(entities)}",
+                f"  - Documents: {num_documents}",
+                f"  - Images: {len(image_entities)}",
+                "",
+                "Frontend can query with:",
+                f'  query: mystery_id = "{mystery_id}"',
+                f'  or: mystery_id = "{mystery_id}" and entity_type = "document"',
+                ""
+            ]))
     
     except Exception as e:
-        logger.error(f"❌ Query failed: {e}")
-        import traceback
-        traceback.print_exc()
+        logger.exception("❌ Query failed: %s", e)
 
 
 if __name__ == "__main__":
-    import sys
-    
     # Allow passing mystery_id as argument
     mystery_id = sys.argv[1] if len(sys.argv) > 1 else None
     
@@ -0,0 +1,60 @@
+"""Test AsyncRateLimiter burst and pacing behaviour."""
+
+import asyncio
+import time
+
+import pytest
+
+from utils.rate_limiter import AsyncRateLimiter
+
+
+def _time_acquisitions(limiter, count):
+    """Acquire ``count`` tokens and return the elapsed wall time in seconds."""
+
+    async def run():
+        start = time.perf_counter()
+        for _ in range(count):
+            async with limiter:
+                pass
+        return time.perf_counter() - start
+
+    return asyncio.run(run())
+
+
+def test_burst_up_to_max_rate_is_immediate():
+    """A fresh limiter lets max_rate acquisitions through without waiting."""
+    limiter = AsyncRateLimiter(max_rate=5, time_period=1.0)
+
+    assert _time_acquisitions(limiter, 5) < 0.1
+
+
+def test_acquisitions_past_burst_are_paced():
+    """Once the bucket is empty, each extra acquisition waits ~time_period / max_rate."""
+    limiter = AsyncRateLimiter(max_rate=5, time_period=0.5)  # one token per 0.1s
+
+    elapsed = _time_acquisitions(limiter, 5 + 3)
+
+    # 3 paced tokens at 0.1s each; allow scheduler slack on either side
+    assert 0.25 <= elapsed < 1.0
+
+
+def test_concurrent_waiters_share_the_rate():
+    """Concurrent callers are serialized onto the same token budget."""
+    limiter = AsyncRateLimiter(max_rate=2, time_period=0.2)  # one token per 0.1s
+
+    async def run():
+        start = time.perf_counter()
+        await asyncio.gather(*(limiter.acquire() for _ in range(4)))
+        return time.perf_counter() - start
+
+    elapsed = asyncio.run(run())
+
+    # 2 from the burst, then 2 paced tokens
+    assert 0.15 <= elapsed < 1.0
+
+
+@pytest.mark.parametrize("max_rate, time_period", [(0, 1.0), (5, 0), (-1, 1.0)])
+def test_rejects_non_positive_configuration(max_rate, time_period):
+    """A zero or negative rate or period is a configuration error."""
+    with pytest.raises(ValueError):
+        AsyncRateLimiter(max_rate=max_rate, time_period=time_period)
@@ -5,10 +5,6 @@ import os
 import sys
 import json
 
-# Add src to path
-backend_dir = os.path.dirname(os.path.dirname(__file__))
-sys.path.insert(0, os.path.join(backend_dir, 'src'))
-
 from narrative.conspiracy.conspiracy_pipeline import ConspiracyPipeline
 from utils.llm_clients import CerebrasClient
 
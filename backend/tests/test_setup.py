@@ -4,55 +4,39 @@ Quick setup verification test.
 Checks if all modules can be imported without errors.
 """
 
+import importlib
 import sys
-from pathlib import Path
-
-# Add src to path (go up to backend, then into src)
-backend_dir = Path(__file__).parent.parent
-sys.path.insert(0, str(backend_dir / "src"))
 
 print("🔍 Testing Infinite Conspiracy Backend Setup")
 print("=" * 60)
 print()
 
-# Test imports
-tests = []
-
-try:
-    from utils import load_config
-    tests.append(("utils.config", True, ""))
-except Exception as e:
-    tests.append(("utils.config", False, str(e)))
-
-try:
-    from utils import setup_logger
-    tests.append(("utils.logger", True, ""))
-except Exception as e:
-    tests.append(("utils.logger", False, str(e)))
-
-try:
-    from utils import CerebrasClient, OpenAIClient
-    tests.append(("utils.llm_clients", True, ""))
-except Exception as e:
-    tests.append(("utils.llm_clients", False, str(e)))
-
-try:
-    from models import Mystery, MysteryMetadata, Document, ProofTree, ValidationResult
-    tests.append(("models", True, ""))
-except Exception as e:
-    tests.append(("models", False, str(e)))
-
-try:
-    from arkiv_integration import ArkivClient, EntityBuilder, ArkivPusher
-    tests.append(("arkiv_integration", True, ""))
-except Exception as e:
-    tests.append(("arkiv_integration", False, str(e)))
-
-try:
-    from blockchain import Web3Client, MysteryRegistrar, ProofManager
-    tests.append(("blockchain", True, ""))
-except Exception as e:
-    tests.append(("blockchain", False, str(e)))
+# Test imports (module name, names it must export)
+modules = [
+    ("utils.config", "utils", ["load_config"]),
+    ("utils.logger", "utils", ["setup_logger"]),
+    ("utils.llm_clients", "utils", ["CerebrasClient", "OpenAIClient"]),
+    ("models", "models", ["Mystery", "MysteryMetadata", "Document", "ProofTree", "ValidationResult"]),
+    ("arkiv_integration", "arkiv_integration", ["ArkivClient", "EntityBuilder", "ArkivPusher"]),
+    ("blockchain", "blockchain", ["Web3Client", "MysteryRegistrar", "ProofManager"]),
+]
+
+
+def probe(spec):
+    """Import a package and check its exports; returns (label, passed, error)."""
+    label, package, names = spec
+    try:
+        module = importlib.import_module(package)
+        for name in names:
+            getattr(module, name)
+        return (label, True, "")
+    except Exception as e:
+        return (label, False, str(e))
+
+
+# Sequential on purpose: packages share web3 imports, and importing them from
+# parallel threads can trip the module-lock deadlock detector
+tests = [probe(m) for m in modules]
 
 # Print results
 print("Import Tests:")
@@ -74,6 +58,7 @@ print("\nConfiguration Test:")
 print("-" * 60)
 
 try:
+    from utils import load_config
     config = load_config()
     print("✅ Config loaded successfully")
     print(f"   Project root: {config.project_root}")
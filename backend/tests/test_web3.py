@@ -3,10 +3,6 @@
 
 import asyncio
 import sys
-from pathlib import Path
-
-# Add src to path
-sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
 
 from utils import load_config, setup_logger
 from blockchain import Web3Client
@@ -40,18 +36,24 @@ async def test_kusama_connection():
             contract_abi_path=None  # Skip ABI loading for connection test
         )
         
-        # Test 1: Connection
+        # Test 1 + 2: Connection and balance are independent RPCs, so issue them together
         logger.info("\nTest 1: Checking connection...")
-        is_connected = await client.is_connected()
-        if is_connected:
+        logger.info("Test 2: Checking account balance...")
+        is_connected, balance = await asyncio.gather(
+            client.is_connected(),
+            client.get_balance(),
+            return_exceptions=True
+        )
+        if isinstance(is_connected, Exception):
+            raise is_connected
+        if is_connected is True:
             logger.info("✅ Connected to Kusama Asset Hub")
         else:
             logger.error("❌ Failed to connect")
             return False
+        if isinstance(balance, Exception):
+            raise balance
         
-        # Test 2: Get balance
-        logger.info("\nTest 2: Checking account balance...")
-        balance = await client.get_balance()
         balance_ksm = client.w3.from_wei(balance, 'ether')
         logger.info(f"✅ Account: {client.address}")
         logger.info(f"✅ Balance: {balance_ksm} KSM (testnet)")
@@ -42,6 +42,8 @@ async function main() {
 
   const deploymentPath = path.join(__dirname, "..", "deployment.json");
   fs.writeFileSync(deploymentPath, JSON.stringify(deploymentInfo, null, 2));
+  // Machine-readable copy for callers parsing stdout (e.g. the backend E2E test)
+  console.log("DEPLOYMENT_JSON=" + JSON.stringify(deploymentInfo));
 
   console.log("💾 Deployment info saved to deployment.json");
   console.log("");